@@ -110,6 +110,11 @@ class Dict(object):
     def __iter__(self):
         return iter(sorted(self.__dict__.keys()))
 
+    def __contains__(self, key):
+        # without this, membership tests fall back to __iter__, which sorts
+        # all keys on every check
+        return key in self.__dict__
+
     def __getattr__(self, key):
         return self.__dict__[key]
 
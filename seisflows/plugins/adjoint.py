@@ -47,7 +47,7 @@ def InstantaneousPhase(syn, obs, nt, dt, eps=0.05):
 
     phi_rsd = phi_syn - phi_obs
     esyn = abs(_analytic(syn))
-    emax = max(esyn**2.)
+    emax = (esyn**2.).max()
 
     wadj = phi_rsd*_np.imag(_analytic(syn))/(esyn**2. + eps*emax) + \
         _np.imag(_analytic(phi_rsd * syn/(esyn**2. + eps*emax)))
@@ -108,9 +108,9 @@ def InstantaneousPhase2(syn, obs, nt, dt, eps=0.):
     esyn = abs(_analytic(syn))
     eobs = abs(_analytic(obs))
 
-    esyn1 = esyn + eps*max(esyn)
-    eobs1 = eobs + eps*max(eobs)
-    esyn3 = esyn**3 + eps*max(esyn**3)
+    esyn1 = esyn + eps*esyn.max()
+    eobs1 = eobs + eps*eobs.max()
+    esyn3 = esyn**3 + eps*(esyn**3).max()
 
     diff1 = syn/(esyn1) - obs/(eobs1)
     diff2 = _hilbert(syn)/esyn1 - _hilbert(obs)/eobs1
@@ -89,8 +89,8 @@ def InstantaneousPhase2(syn, obs, nt, dt, eps=0.):
     esyn = abs(_analytic(syn))
     eobs = abs(_analytic(obs))
 
-    esyn1 = esyn + eps*max(esyn)
-    eobs1 = eobs + eps*max(eobs)
+    esyn1 = esyn + eps*esyn.max()
+    eobs1 = eobs + eps*eobs.max()
 
     diff = syn/esyn1 - obs/eobs1
 
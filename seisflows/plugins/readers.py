@@ -55,8 +55,8 @@ def su(path, filename):
 def ascii(path, filenames):
     """ Reads SPECFEM3D-style ascii data
     """
-    from numpy import loadtxt
     from obspy.core import Stream, Stats, Trace
+    from seisflows.tools.array import loadtxt
 
     stream = Stream()
     for filename in filenames:
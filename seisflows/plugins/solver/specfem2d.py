@@ -101,33 +101,30 @@ def smooth_legacy(input_path='', output_path='', parameters=[], span=0.):
         if solver.mesh_properties.nproc != 1:
             raise NotImplementedError
 
-        # intialize arrays
-        kernels = {}
-        for key in parameters or solver.parameters:
-            kernels[key] = []
-
-        coords = {}
-        for key in ['x', 'z']:
-            coords[key] = []
+        # since there is only one slice, kernels and coordinates are held as
+        # plain arrays rather than lists indexed by processor rank
+        keys = parameters or solver.parameters
 
         # read kernels
-        for key in parameters or solver.parameters:
-            kernels[key] += solver.io.read_slice(input_path, key+'_kernel', 0)
+        kernels = {}
+        for key in keys:
+            kernels[key] = solver.io.read_slice(
+                input_path, key+'_kernel', 0)[0]
 
         if not span:
             return kernels
 
         # read coordinates
-        for key in ['x', 'z']:
-            coords[key] += solver.io.read_slice(PATH.MODEL_INIT, key, 0)
-
-        mesh = array.stack(coords['x'][0], coords['z'][0])
+        x = solver.io.read_slice(PATH.MODEL_INIT, 'x', 0)[0]
+        z = solver.io.read_slice(PATH.MODEL_INIT, 'z', 0)[0]
+        mesh = array.stack(x, z)
 
-        # apply smoother
-        for key in parameters or solver.parameters:
-            kernels[key] = [array.meshsmooth(kernels[key][0], mesh, span)]
+        # apply smoother, to all parameters at once so that the mesh is
+        # only interpolated onto the regular grid once
+        smoothed = array.meshsmooth(
+            array.stack(*[kernels[key] for key in keys]), mesh, span)
 
         # write smooth kernels
-        for key in parameters or solver.parameters:
-            solver.io.write_slice(kernels[key][0], output_path, key+'_kernel',
+        for i, key in enumerate(keys):
+            solver.io.write_slice(smoothed[:, i], output_path, key+'_kernel',
                                   0)
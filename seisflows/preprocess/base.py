@@ -13,7 +13,7 @@ import numpy as np
 import obspy
 
 # Local imports
-from seisflows.tools import msg, unix
+from seisflows.tools import array, msg, unix
 from seisflows.tools.tools import exists, getset
 from seisflows.config import ParameterError
 from seisflows.plugins import adjoint, misfit, readers, writers
@@ -130,9 +130,9 @@ class base(object):
 
         filename = path+'/'+'residuals'
         if exists(filename):
-            residuals.extend(list(np.loadtxt(filename)))
+            residuals.extend(list(array.loadtxt(filename)))
 
-        np.savetxt(filename, residuals)
+        array.savetxt(filename, residuals)
 
     def sum_residuals(self, files):
         """
@@ -143,7 +143,7 @@ class base(object):
         """
         total_misfit = 0.
         for filename in files:
-            total_misfit += np.sum(np.loadtxt(filename)**2.)
+            total_misfit += np.sum(array.loadtxt(filename, mmap=True)**2.)
         return total_misfit
 
     def write_adjoint_traces(self, path, syn, obs, channel):
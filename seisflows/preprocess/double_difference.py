@@ -15,7 +15,7 @@ from obspy.core import Stream, Trace
 
 # Local imports
 from seisflows.plugins import adjoint, misfit
-from seisflows.tools import unix
+from seisflows.tools import array, unix
 from seisflows.config import ParameterError, custom_import
 
 PAR = sys.modules['seisflows_parameters']
@@ -81,9 +81,9 @@ class double_difference(custom_import('preprocess', 'base')):
 
         np.savetxt(path + '/' + 'dist_ij', dist)
         np.savetxt(path + '/' + 'count', count)
-        np.savetxt(path + '/' + 'delta_syn_ij', delta_syn)
+        array.savetxt(path + '/' + 'delta_syn_ij', delta_syn)
         np.savetxt(path + '/' + 'delta_obs_ij', delta_obs)
-        np.savetxt(path + '/' + 'rsd_ij', delta_syn-delta_obs)
+        array.savetxt(path + '/' + 'rsd_ij', delta_syn-delta_obs)
 
         # to get residuals, sum over all station pairs
         rsd = abs(delta_syn-delta_obs).sum(axis=0)
@@ -95,18 +95,18 @@ class double_difference(custom_import('preprocess', 'base')):
         # write residuals to text file
         filename = path + '/' + 'residuals'
         if exists(filename):
-            rsdlist = list(np.loadtxt(filename))
+            rsdlist = list(array.loadtxt(filename))
         else:
             rsdlist = []
         rsdlist += [rsd]
-        np.savetxt(filename, rsdlist)
+        array.savetxt(filename, rsdlist)
 
     def sum_residuals(self):
         """ Sums squares of residuals
         """
         total_misfit = 0.
         for path in paths:
-            total_misfit += np.sum(np.loadtxt(path)**2.)
+            total_misfit += np.sum(array.loadtxt(path, mmap=True)**2.)
         return total_misfit
 
     def write_adjoint_traces(self, path, syn, dat, channel):
@@ -115,8 +115,8 @@ class double_difference(custom_import('preprocess', 'base')):
         nt, dt, _ = self.get_time_scheme(syn)
         nr, _ = self.get_network_size(syn)
 
-        Del = np.loadtxt(path + '/' + '../../delta_syn_ij')
-        rsd = np.loadtxt(path + '/' + '../../rsd_ij')
+        Del = array.loadtxt(path + '/' + '../../delta_syn_ij')
+        rsd = array.loadtxt(path + '/' + '../../rsd_ij')
 
         # initialize trace arrays
         adj = Stream()
@@ -154,8 +154,8 @@ class double_difference(custom_import('preprocess', 'base')):
 
         vjo = self.shift(vj, -t0/dt)
 
-        w = sum(vi*vjo*dt)
-        w = max(vjo)
+        w = np.sum(vi*vjo*dt)
+        w = vjo.max()
         if w:
             vjo /= w
 
@@ -172,7 +172,7 @@ class double_difference(custom_import('preprocess', 'base')):
             return traces
 
     def load_weights(self):
-            return np.loadtxt(PATH.WEIGHTS)[:, -1]
+            return array.loadtxt(PATH.WEIGHTS)[:, -1]
 
     def shift(self, v, it):
         """ Shifts time series a given number of steps
@@ -8,6 +8,7 @@
 # Import system modules
 import subprocess
 import sys
+import threading
 from functools import partial
 from glob import glob
 from importlib import import_module
@@ -19,9 +20,9 @@ import numpy as np
 # Local imports
 from seisflows.config import ParameterError, custom_import
 from seisflows.plugins import solver_io
-from seisflows.tools import msg, unix
+from seisflows.tools import array, msg, unix
 from seisflows.tools.seismic import Container, call_solver
-from seisflows.tools.tools import Struct, diff, exists
+from seisflows.tools.tools import Struct, exists
 
 PAR = sys.modules['seisflows_parameters']
 PATH = sys.modules['seisflows_paths']
@@ -156,11 +157,13 @@ class base(object):
             unix.cp(src, dst)
 
         else:
-            # generate data on the fly
+            # generate data on the fly; traces are exported while the initial
+            # model mesh is prepared
             self.generate_data(
                 model_path=PATH.MODEL_TRUE,
                 model_name='model_true',
-                model_type='gll')
+                model_type='gll',
+                background=True)
 
         # prepare initial model mesh
         self.generate_mesh(
@@ -168,6 +171,10 @@ class base(object):
             model_name='model_init',
             model_type='gll')
 
+        # wait for any trace exports started while generating data, since the
+        # exported directories are read from below
+        self.wait_io()
+
         # Adjoint traces (in scratch/solver/source_name/traces/adj)are
         # initialized below by writing zeros for all channels (even the ones
         # that are not actually in use, as required by specfem)
@@ -220,10 +227,13 @@ class base(object):
         """
         unix.cd(self.cwd)
         self.adjoint()
-        self.export_kernels(path)
         if export_traces:
-            self.export_traces(path+'/'+'traces/syn', prefix='traces/syn')
-            self.export_traces(path+'/'+'traces/adj', prefix='traces/adj')
+            self.export_traces(path+'/'+'traces/syn', prefix='traces/syn',
+                               background=True)
+            self.export_traces(path+'/'+'traces/adj', prefix='traces/adj',
+                               background=True)
+        self.export_kernels(path)
+        self.wait_io()
 
     def apply_hess(self, path=''):
         """
@@ -294,12 +304,15 @@ class base(object):
         """
         unix.mkdir(path)
 
-        # fill in any missing parameters
-        missing_keys = diff(parameters, dict.keys())
-        for iproc in range(self.mesh_properties.nproc):
+        # fill in any missing parameters, reading the initial model once for
+        # all of them
+        missing_keys = [key for key in parameters if key not in dict]
+        if missing_keys:
+            reference = self.load(
+                PATH.MODEL_INIT,
+                parameters=[prefix+key+suffix for key in missing_keys])
             for key in missing_keys:
-                dict[key] += self.io.read_slice(
-                    PATH.MODEL_INIT, prefix+key+suffix, iproc)
+                dict[key] += reference[prefix+key+suffix]
 
         # write slices to disk
         for iproc in range(self.mesh_properties.nproc):
@@ -310,24 +323,25 @@ class base(object):
     def merge(self, model, parameters=[]):
         """ Converts model from dictionary to vector representation
         """
-        m = np.array([])
+        m = []
         for key in parameters or self.parameters:
             for iproc in range(self.mesh_properties.nproc):
-                m = np.append(m, model[key][iproc])
-        return m
+                m += [model[key][iproc]]
+        return np.concatenate(m).astype(np.float64, copy=False)
 
     def split(self, m, parameters=[]):
         """ Converts model from vector to dictionary representation
         """
-        nproc = self.mesh_properties.nproc
         ngll = self.mesh_properties.ngll
+
+        # slice offsets within the block for a single parameter, computed
+        # once rather than summed over for every parameter and slice
+        offsets = np.cumsum([0] + ngll)
+        nn = offsets[-1]
+
         model = Container()
         for idim, key in enumerate(parameters or self.parameters):
-            model[key] = []
-            for iproc in range(nproc):
-                imin = sum(ngll)*idim + sum(ngll[:iproc])
-                imax = sum(ngll)*idim + sum(ngll[:iproc+1])
-                model[key] += [m[imin:imax]]
+            model[key] = np.split(m[idim*nn:(idim+1)*nn], offsets[1:-1])
         return model
 
     # Postprocessing wrappers
@@ -418,14 +432,51 @@ class base(object):
 
         src = join(self.cwd, 'residuals')
         dst = join(path, 'residuals', self.source_name)
+        array.rmcache(src)
         unix.mv(src, dst)
 
-    def export_traces(self, path, prefix='traces/obs'):
+    def export_traces(self, path, prefix='traces/obs', background=False):
         unix.mkdir(join(path))
 
         src = join(self.cwd, prefix)
         dst = join(path, self.source_name)
-        unix.cp(src, dst)
+        if background:
+            self.start_io(unix.rsync, src, dst)
+        else:
+            unix.rsync(src, dst)
+
+    def start_io(self, func, *args, **kwargs):
+        """ Runs file transfer in a background thread, so that it overlaps
+            with subsequent work. Paths must be absolute, since the working
+            directory may change in the meantime. Call wait_io before reading
+            from or writing to the directories being transferred
+        """
+        def target():
+            try:
+                func(*args, **kwargs)
+            except Exception:
+                thread.exc_info = sys.exc_info()
+
+        thread = threading.Thread(target=target)
+        thread.exc_info = None
+        thread.start()
+
+        if not hasattr(self, '_io_threads'):
+            self._io_threads = []
+        self._io_threads += [thread]
+
+    def wait_io(self):
+        """ Waits for file transfers started by start_io, reraising the
+            first error any of them encountered
+        """
+        threads = getattr(self, '_io_threads', [])
+        self._io_threads = []
+        for thread in threads:
+            thread.join()
+        for thread in threads:
+            if thread.exc_info:
+                raise thread.exc_info[0], thread.exc_info[1], \
+                    thread.exc_info[2]
 
     def rename_kernels(self):
         """ Works around conflicting kernel filename conventions
@@ -600,8 +651,13 @@ class base(object):
 
     @property
     def cwd(self):
-        # returns working directory currently in use
-        return join(PATH.SOLVER, self.source_name)
+        # returns working directory currently in use; directories are
+        # computed once for all sources, since the taskid can change between
+        # calls on the same instance
+        if not hasattr(self, '_cwds'):
+            self._cwds = [join(PATH.SOLVER, name)
+                          for name in self.source_names]
+        return self._cwds[self.taskid]
 
     @property
     def source_names(self):
@@ -15,10 +15,10 @@ import numpy as np
 
 # Local imports
 from seisflows.plugins.solver.specfem2d import smooth_legacy
-from seisflows.tools.seismic import getpar, setpar
+from seisflows.tools.seismic import getpar, setpar, setpars
 from seisflows.tools import msg
 from seisflows.tools import unix
-from seisflows.tools.seismic import call_solver
+from seisflows.tools.seismic import call_solver, call_solver_async
 from seisflows.tools.tools import exists
 from seisflows.config import ParameterError, custom_import
 
@@ -84,15 +84,18 @@ class specfem2d(custom_import('solver', 'base')):
 
         f0 = getpar('f0', file='DATA/SOURCE', cast=float)
 
+        # Par_file changes are collected and written all at once
+        pars = []
+
         if nt != PAR.NT:
             if self.taskid == 0:
                 print "WARNING: nt != PAR.NT", nt, PAR.NT
-            setpar('nt', PAR.NT)
+            pars += [('nt', PAR.NT)]
 
         if dt != PAR.DT:
             if self.taskid == 0:
                 print "WARNING: dt != PAR.DT", dt, PAR.DT
-            setpar('deltat', PAR.DT)
+            pars += [('deltat', PAR.DT)]
 
         if f0 != PAR.F0:
             if self.taskid == 0:
@@ -105,18 +108,23 @@ class specfem2d(custom_import('solver', 'base')):
 
         if 'MULTIPLES' in PAR:
             if PAR.MULTIPLES:
-                setpar('absorbtop', '.false.')
+                pars += [('absorbtop', '.false.')]
             else:
-                setpar('absorbtop', '.true.')
+                pars += [('absorbtop', '.true.')]
+
+        if pars:
+            setpars(pars)
 
-    def generate_data(self, **model_kwargs):
+    def generate_data(self, background=False, **model_kwargs):
         """ Generates data (perform meshing and database generation first)
+
+          If background is True, traces are exported in the background and
+          the caller must call wait_io
         """
         self.generate_mesh(**model_kwargs)
 
         unix.cd(self.cwd)
-        setpar('SIMULATION_TYPE', '1')
-        setpar('SAVE_FORWARD', '.false.')
+        setpars([('SIMULATION_TYPE', '1'), ('SAVE_FORWARD', '.false.')])
 
         call_solver(system.mpiexec(), 'bin/xmeshfem2D', output='mesher.log')
         call_solver(system.mpiexec(), 'bin/xspecfem2D', output='solver.log')
@@ -126,12 +134,13 @@ class specfem2d(custom_import('solver', 'base')):
             # work around SPECFEM2D's different file names (depending on the
             # version used :
             unix.rename('single_p.su', 'single.su', src)
-            src = glob('OUTPUT_FILES/*.su')
+            src = [name.replace('single_p.su', 'single.su') for name in src]
             dst = 'traces/obs'
             unix.mv(src, dst)
 
         if PAR.SAVETRACES:
-            self.export_traces(PATH.OUTPUT+'/'+'traces/obs')
+            self.export_traces(PATH.OUTPUT+'/'+'traces/obs',
+                               background=background)
 
     def initialize_adjoint_traces(self):
         super(specfem2d, self).initialize_adjoint_traces()
@@ -182,8 +191,7 @@ class specfem2d(custom_import('solver', 'base')):
     def forward(self, path='traces/syn'):
         """ Calls SPECFEM2D forward solver
         """
-        setpar('SIMULATION_TYPE', '1')
-        setpar('SAVE_FORWARD', '.true.')
+        setpars([('SIMULATION_TYPE', '1'), ('SAVE_FORWARD', '.true.')])
 
         call_solver(system.mpiexec(), 'bin/xmeshfem2D')
         call_solver(system.mpiexec(), 'bin/xspecfem2D')
@@ -193,24 +201,30 @@ class specfem2d(custom_import('solver', 'base')):
             # work around SPECFEM2D's different file names (depending on the
             # version used :
             unix.rename('single_p.su', 'single.su', filenames)
-            filenames = glob('OUTPUT_FILES/*.su')
+            filenames = [name.replace('single_p.su', 'single.su')
+                         for name in filenames]
             unix.mv(filenames, path)
 
     def adjoint(self):
         """ Calls SPECFEM2D adjoint solver
         """
-        setpar('SIMULATION_TYPE', '3')
-        setpar('SAVE_FORWARD', '.false.')
-        unix.rm('SEM')
-        unix.ln('traces/adj', 'SEM')
+        setpars([('SIMULATION_TYPE', '3'), ('SAVE_FORWARD', '.false.')])
 
-        # hack to deal with different SPECFEM2D name conventions for
-        # regular traces and 'adjoint' traces
-        if PAR.FORMAT in ['SU', 'su']:
-            files = glob('traces/adj/*.su')
-            unix.rename('.su', '.su.adj', files)
+        # the mesher does not depend on the adjoint traces, so run it while
+        # they are being put in place
+        wait = call_solver_async(system.mpiexec(), 'bin/xmeshfem2D')
+        try:
+            unix.rm('SEM')
+            unix.ln('traces/adj', 'SEM')
+
+            # hack to deal with different SPECFEM2D name conventions for
+            # regular traces and 'adjoint' traces
+            if PAR.FORMAT in ['SU', 'su']:
+                files = glob('traces/adj/*.su')
+                unix.rename('.su', '.su.adj', files)
+        finally:
+            wait()
 
-        call_solver(system.mpiexec(), 'bin/xmeshfem2D')
         call_solver(system.mpiexec(), 'bin/xspecfem2D')
 
     # File transfer utilities
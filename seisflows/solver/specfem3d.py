@@ -16,7 +16,7 @@ import numpy as np
 
 # Local imports
 import seisflows.plugins.solver.specfem3d as solvertools
-from seisflows.tools.seismic import getpar, setpar
+from seisflows.tools.seismic import getpar, setpar, setpars
 from seisflows.tools import unix
 from seisflows.tools.seismic import call_solver
 from seisflows.tools.tools import exists
@@ -57,14 +57,16 @@ class specfem3d(custom_import('solver', 'base')):
         if PAR.FORMAT != 'su':
             raise Exception()
 
-    def generate_data(self, **model_kwargs):
+    def generate_data(self, background=False, **model_kwargs):
         """ Generates data
+
+          If background is True, traces are exported in the background and
+          the caller must call wait_io
         """
         self.generate_mesh(**model_kwargs)
 
         unix.cd(self.cwd)
-        setpar('SIMULATION_TYPE', '1')
-        setpar('SAVE_FORWARD', '.true.')
+        setpars([('SIMULATION_TYPE', '1'), ('SAVE_FORWARD', '.true.')])
         call_solver(system.mpiexec(), 'bin/xspecfem3D')
 
         if PAR.FORMAT in ['SU', 'su']:
@@ -73,7 +75,8 @@ class specfem3d(custom_import('solver', 'base')):
             unix.mv(src, dst)
 
         if PAR.SAVETRACES:
-            self.export_traces(PATH.OUTPUT+'/'+'traces/obs')
+            self.export_traces(PATH.OUTPUT+'/'+'traces/obs',
+                               background=background)
 
     def generate_mesh(self, model_path=None, model_name=None, model_type='gll'):
         """ Performs meshing and database generation
@@ -118,8 +121,7 @@ class specfem3d(custom_import('solver', 'base')):
     def forward(self, path='traces/syn'):
         """ Calls SPECFEM3D forward solver
         """
-        setpar('SIMULATION_TYPE', '1')
-        setpar('SAVE_FORWARD', '.true.')
+        setpars([('SIMULATION_TYPE', '1'), ('SAVE_FORWARD', '.true.')])
         call_solver(system.mpiexec(), 'bin/xgenerate_databases')
         call_solver(system.mpiexec(), 'bin/xspecfem3D')
 
@@ -131,8 +133,7 @@ class specfem3d(custom_import('solver', 'base')):
     def adjoint(self):
         """ Calls SPECFEM3D adjoint solver
         """
-        setpar('SIMULATION_TYPE', '3')
-        setpar('SAVE_FORWARD', '.false.')
+        setpars([('SIMULATION_TYPE', '3'), ('SAVE_FORWARD', '.false.')])
         unix.rm('SEM')
         unix.ln('traces/adj', 'SEM')
         call_solver(system.mpiexec(), 'bin/xspecfem3D')
@@ -217,11 +218,14 @@ class specfem3d(custom_import('solver', 'base')):
         unix.cd(self.cwd+'/'+'traces/obs')
 
         if PAR.FORMAT in ['SU', 'su']:
+            # list directory only once, then group by channel
+            names = sorted(glob('*_d?_SU'))
             if not PAR.CHANNELS:
-                return sorted(glob('*_d?_SU'))
+                return names
             filenames = []
             for channel in PAR.CHANNELS:
-                filenames += sorted(glob('*_d'+channel+'_SU'))
+                filenames += [name for name in names
+                              if name.endswith('_d'+channel+'_SU')]
             return filenames
 
         else:
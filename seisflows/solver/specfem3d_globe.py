@@ -58,8 +58,11 @@ class specfem3d_globe(custom_import('solver', 'base')):
         if 'FORMAT' not in PAR:
             raise Exception()
 
-    def generate_data(self, **model_kwargs):
+    def generate_data(self, background=False, **model_kwargs):
         """ Generates data
+
+          If background is True, traces are exported in the background and
+          the caller must call wait_io
         """
         self.generate_mesh(**model_kwargs)
 
@@ -74,7 +77,8 @@ class specfem3d_globe(custom_import('solver', 'base')):
             unix.mv(src, dst)
 
         if PAR.SAVETRACES:
-            self.export_traces(PATH.OUTPUT+'/'+'traces/obs')
+            self.export_traces(PATH.OUTPUT+'/'+'traces/obs',
+                               background=background)
 
     def generate_mesh(self, model_path=None, model_name=None,
                       model_type='gll'):
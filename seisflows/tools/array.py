@@ -15,11 +15,8 @@ import os
 import numpy as np
 
 # Import utilities from Scipy
-import scipy.signal as _signal
 import scipy.interpolate as _interp
-
-# Local imports
-from seisflows.tools.math import gauss2
+import scipy.ndimage as _ndimage
 
 
 def count_zeros(a):
@@ -90,36 +87,158 @@ def savenpy(filename, v):
     os.rename(filename + '.npy', filename)
 
 
+def loadtxt(filename, mmap=False):
+    """ Loads whitespace delimited text file
+
+      If the file was written by savetxt and has not been modified or
+      replaced since, values are read from the binary cache written alongside
+      it, which skips parsing altogether. Other files are parsed, and no
+      cache is written for them, since most are read only once
+
+      If mmap is True, the cached values are memory mapped read-only rather
+      than read into memory, so that taking a single column reads only that
+      column from disk
+    """
+    M = _loadcache(filename, _stamp(filename), mmap)
+    if M is not None:
+        return M
+
+    return _parsetxt(filename)
+
+
+def savetxt(filename, M, fmt='%.18e'):
+    """ Saves text file, along with the binary cache read by loadtxt
+
+      Uses the pandas C formatter when available, which is much faster than
+      np.savetxt for large arrays
+    """
+    M = np.asarray(M, dtype=np.float64)
+    try:
+        import pandas
+    except ImportError:
+        np.savetxt(filename, M, fmt)
+    else:
+        pandas.DataFrame(M).to_csv(filename, sep=' ', header=False,
+                                   index=False, float_format=fmt,
+                                   na_rep='nan')
+    _savecache(filename, _stamp(filename), np.squeeze(M))
+
+
+def rmcache(filename):
+    """ Removes the binary cache written by savetxt, for instance before the
+      text file is moved elsewhere, where the cache would no longer apply
+    """
+    cache = _cachename(filename)
+    if os.path.exists(cache):
+        os.remove(cache)
+
+
+def _parsetxt(filename):
+    """ Parses whitespace delimited text file
+
+      Uses the pandas C parser when available, which is much faster than
+      np.loadtxt for large files. Values are parsed with round-trip precision,
+      so that results are identical to np.loadtxt. As with np.loadtxt,
+      singleton dimensions are squeezed out
+    """
+    try:
+        import pandas
+    except ImportError:
+        return np.loadtxt(filename, dtype=np.float64)
+
+    M = pandas.read_csv(filename, sep=r'\s+', header=None, comment='#',
+                        dtype=np.float64, engine='c',
+                        float_precision='round_trip').values
+    return np.squeeze(M)
+
+
+def _cachename(filename):
+    # hidden, so that it is not picked up by wildcards
+    dirname, basename = os.path.split(filename)
+    return os.path.join(dirname, '.' + basename + '.npy')
+
+
+def _stamp(filename):
+    # identifies the current contents of a file; mtime alone is not enough,
+    # since a file replaced by another within the mtime resolution would go
+    # unnoticed
+    st = os.stat(filename)
+    return repr((st.st_ino, st.st_size, st.st_mtime, st.st_ctime))
+
+
+def _loadcache(filename, stamp, mmap=False):
+    # returns None unless the cache was written for the given stamp
+    cache = _cachename(filename)
+    try:
+        with open(cache, 'rb') as f:
+            if str(np.load(f)) != stamp:
+                return None
+            if not mmap:
+                return np.load(f)
+
+            # the values follow the stamp, so they are mapped from the offset
+            # at which their header ends
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                header = np.lib.format.read_array_header_1_0(f)
+            else:
+                header = np.lib.format.read_array_header_2_0(f)
+            shape, fortran_order, dtype = header
+            return np.memmap(cache, dtype=dtype, mode='r', offset=f.tell(),
+                             shape=shape, order='F' if fortran_order else 'C')
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _savecache(filename, stamp, M):
+    # write to a temporary file first, so that concurrent readers never see a
+    # partially written cache; failing to write the cache is not an error
+    cache = _cachename(filename)
+    tmpname = cache + '.%d' % os.getpid()
+    try:
+        with open(tmpname, 'wb') as f:
+            np.save(f, np.array(stamp))
+            # column-major, so that columns are contiguous on disk; other
+            # shapes are saved as is, since asfortranarray would turn a
+            # single value into a 1-d array
+            if M.ndim == 2:
+                M = np.asfortranarray(M)
+            np.save(f, M)
+        os.rename(tmpname, cache)
+    except (IOError, OSError):
+        pass
+
+
 # In the function and variable names, we use 'grid' to describe a set of
 # structured coordinates, and 'mesh' to describe a set of unstructured
 # coordinates
 
 def gridsmooth(Z, span):
     """ Smooths values on 2D rectangular grid
+
+      If Z has a third dimension, each Z[:, :, i] is smoothed separately
+
+      The Gaussian has a standard deviation of span/2 grid points and is
+      centered on each grid point, also when span is not an integer
     """
-    import warnings
-    warnings.filterwarnings('ignore')
-
-    x = np.linspace(-2.*span, 2.*span, 2.*span + 1.)
-    y = np.linspace(-2.*span, 2.*span, 2.*span + 1.)
-    (X, Y) = np.meshgrid(x, y)
-    mu = np.array([0., 0.])
-    sigma = np.diag([span, span])**2.
-    F = gauss2(X, Y, mu, sigma)
-    F = F/np.sum(F)
+    # Gaussian kernel with standard deviation span/2 grid points, truncated
+    # at two standard deviations
+    sigma = [span/2., span/2.] + [0.]*(Z.ndim-2)
     W = np.ones(Z.shape)
-    Z = _signal.convolve2d(Z, F, 'same')
-    W = _signal.convolve2d(W, F, 'same')
+    Z = _ndimage.gaussian_filter(Z, sigma, mode='constant', truncate=2.)
+    W = _ndimage.gaussian_filter(W, sigma, mode='constant', truncate=2.)
     Z = Z/W
     return Z
 
 
 def meshsmooth(v, mesh, span):
     """ Smooths values on 2D unstructured mesh
+
+      To smooth several fields defined on the same mesh, pass them as columns
+      of v, so that interpolation weights are computed only once
     """
     V, grid = mesh2grid(v, mesh)
-    nz, nx = V.shape
-    W = np.ones((nz, nx))
+    W = np.ones(V.shape)
 
     # maks nans
     inan = np.isnan(V)
@@ -147,12 +266,11 @@ def mesh2grid(v, mesh):
     z = mesh[:, 1]
     lx = x.max() - x.min()
     lz = z.max() - z.min()
-    nn = v.size
+    nn = v.shape[0]
 
+    # grid with the same aspect ratio as the mesh and about as many points
     nx = int(np.around(np.sqrt(nn*lx/lz)))
     nz = int(np.around(np.sqrt(nn*lz/lx)))
-    dx = lx/nx
-    dz = lz/nz
 
     # construct structured grid
     x = np.linspace(x.min(), x.max(), nx)
@@ -164,12 +282,12 @@ def mesh2grid(v, mesh):
     V = _interp.griddata(mesh, v, grid, 'linear')
 
     # workaround edge issues
-    if np.any(np.isnan(V)):
+    inan = np.isnan(V)
+    if np.any(inan):
         W = _interp.griddata(mesh, v, grid, 'nearest')
-        for i in np.where(np.isnan(V)):
-            V[i] = W[i]
+        V[inan] = W[inan]
 
-    V = np.reshape(V, (nz, nx))
+    V = np.reshape(V, (nz, nx) + v.shape[1:])
     return V, grid
 
 
@@ -177,4 +295,9 @@ def grid2mesh(V, grid, mesh):
     """ Interpolates from structured coordinates (grid) to unstructured
         coordinates (mesh)
     """
-    return _interp.griddata(grid, V.flatten(), mesh, 'linear')
+    nz, nx = V.shape[:2]
+    x = grid[:nx, 0]
+    z = grid[::nx, 1]
+    interpolator = _interp.RegularGridInterpolator(
+        (z, x), V, bounds_error=False, fill_value=None)
+    return interpolator(mesh[:, ::-1])
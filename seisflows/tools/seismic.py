@@ -7,6 +7,8 @@
 
 # Import system modules
 import os
+import re
+import shlex
 import subprocess
 import sys
 from collections import defaultdict
@@ -20,6 +22,9 @@ import numpy as np
 from seisflows.tools import msg, unix
 from seisflows.tools.tools import iterable
 
+# characters that require a command to be run through the shell
+_shell_syntax = re.compile(r'[|&;<>()$`\\"\'*?\[\]#~=%{}\n]')
+
 
 def call_solver(mpiexec, executable, output='solver.log'):
     """ Calls MPI solver executable
@@ -27,20 +32,49 @@ def call_solver(mpiexec, executable, output='solver.log'):
       A less complicated version, without error catching, would be
       subprocess.call(mpiexec +' '+ executable, shell=True)
     """
+    wait = call_solver_async(mpiexec, executable, output)
+    wait()
+
+
+def call_solver_async(mpiexec, executable, output='solver.log'):
+    """ Launches MPI solver executable without waiting for it to finish
+
+      Returns a function which blocks until the solver exits, so that
+      independent work can be done in the meantime. Errors are handled the
+      same way as in call_solver
+
+      A shell is only spawned if the command actually makes use of shell
+      syntax; otherwise the command is executed directly
+    """
+    command = mpiexec + ' ' + executable
+    if _shell_syntax.search(command):
+        args, shell = command, True
+    else:
+        args, shell = shlex.split(command), False
+
     try:
-        f = open(output, 'w')
-        subprocess.check_call(
-            mpiexec + ' ' + executable,
-            shell=True,
-            stdout=f)
-    except subprocess.CalledProcessError, err:
-        print msg.SolverError % (mpiexec + ' ' + executable)
+        f = open(output, 'wb')
+    except IOError:
+        print msg.SolverError % command
         sys.exit(-1)
+
+    try:
+        process = subprocess.Popen(args, shell=shell, stdout=f)
     except OSError:
-        print msg.SolverError % (mpiexec + ' ' + executable)
-        sys.exit(-1)
-    finally:
         f.close()
+        print msg.SolverError % command
+        sys.exit(-1)
+
+    def wait():
+        try:
+            status = process.wait()
+        finally:
+            f.close()
+        if status != 0:
+            print msg.SolverError % command
+            sys.exit(-1)
+
+    return wait
 
 
 class Minmax(defaultdict):
@@ -115,24 +149,35 @@ def getpar(key, file='DATA/Par_file', sep='=', cast=str, noOutput=False):
 def setpar(key, val, filename='DATA/Par_file', path='.', sep='='):
     """ Writes parameter to text file
     """
+    setpars([(key, val)], filename, path, sep)
 
-    val = str(val)
+
+def setpars(pars, filename='DATA/Par_file', path='.', sep='='):
+    """ Writes several parameters to text file, reading and writing the file
+        only once
+
+      :input pars :: dictionary or list of (key, val) pairs
+    """
+    if isinstance(pars, dict):
+        pars = pars.items()
+    pars = [(key, str(val)) for key, val in pars]
 
     # read line by line
     with open(path + '/' + filename, 'r') as file:
         lines = []
         for line in file:
-            if find(line, key) == 0:
-                # read key
-                key, _ = _split(line, sep)
-                # read comment
-                _, comment = _split(line, '#')
-                n = len(line) - len(key) - len(val) - len(comment) - 2
-                # replace line
-                if comment:
-                    line = _merge(key, sep, val, ' '*n, '#', comment)
-                else:
-                    line = _merge(key, sep, str(val), '\n')
+            for key, val in pars:
+                if find(line, key) == 0:
+                    # read key
+                    name, _ = _split(line, sep)
+                    # read comment
+                    _, comment = _split(line, '#')
+                    n = len(line) - len(name) - len(val) - len(comment) - 2
+                    # replace line
+                    if comment:
+                        line = _merge(name, sep, val, ' '*n, '#', comment)
+                    else:
+                        line = _merge(name, sep, val, '\n')
             lines.append(line)
 
     # write file
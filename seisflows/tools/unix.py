@@ -94,8 +94,15 @@ def ls(path):
 
 
 def mkdir(dirs):
+    # directories that already exist are skipped up front, so that repeated
+    # calls neither sleep nor issue further filesystem requests
+    dirs = [dir for dir in iterable(dirs) if not os.path.isdir(dir)]
+    if not dirs:
+        return
+
+    # the random delay staggers concurrent tasks creating the same directory
     time.sleep(1.0 * random.random())
-    for dir in iterable(dirs):
+    for dir in dirs:
         if not os.path.isdir(dir):
             os.makedirs(dir)
 
@@ -130,6 +137,34 @@ def rm(path=''):
             shutil.rmtree(name)
 
 
+def rsync(src='', dst=''):
+    """ Copies files (given as list), or the contents of a directory, into
+        directory dst using a single rsync process, which avoids per-file
+        overhead when writing to parallel filesystems. Falls back to cp when
+        rsync is not available. Hidden files, such as the caches written by
+        array.savetxt, are skipped
+    """
+    if isinstance(src, (list, tuple)):
+        if not src:
+            return
+        args = list(src)
+    else:
+        args = [join(src, '')]
+
+    if not which('rsync'):
+        # like rsync, merge into dst rather than nest src inside it
+        mkdir(dst)
+        if not isinstance(src, (list, tuple)):
+            args = [join(src, name) for name in os.listdir(src)]
+        for name in args:
+            if not basename(name).startswith('.'):
+                cp(name, dst)
+        return
+
+    command = ['rsync', '-a', '-W', '--inplace', '--exclude=.*']
+    subprocess.check_call(command + args + [join(dst, '')])
+
+
 def select(items, prompt=''):
     while True:
         if prompt:
@@ -0,0 +1,153 @@
+
+import unittest
+
+import os
+from tempfile import NamedTemporaryFile
+
+import numpy as np
+
+from seisflows.tools import array
+
+
+class TestArrayTools(unittest.TestCase):
+    def setUp(self):
+        tmp_file = NamedTemporaryFile(mode='wb', delete=False)
+        tmp_file.close()
+        self.filename = tmp_file.name
+
+    def tearDown(self):
+        os.remove(self.filename)
+        cache = array._cachename(self.filename)
+        if os.path.exists(cache):
+            os.remove(cache)
+
+    def test_loadtxt(self):
+        M = np.random.rand(1000, 5)
+        np.savetxt(self.filename, M)
+        self.assertTrue(np.array_equal(array.loadtxt(self.filename),
+                                       np.loadtxt(self.filename)))
+
+    def test_loadtxt_single_column(self):
+        v = np.random.rand(100)
+        np.savetxt(self.filename, v)
+        self.assertEqual(array.loadtxt(self.filename).shape, (100,))
+        self.assertTrue(np.array_equal(array.loadtxt(self.filename),
+                                       np.loadtxt(self.filename)))
+
+    def test_loadtxt_cached_shape(self):
+        for M in [np.random.rand(1), np.random.rand(10),
+                  np.random.rand(10, 3)]:
+            array.savetxt(self.filename, M)
+            cached = array.loadtxt(self.filename)
+            self.assertEqual(array.loadtxt(self.filename, mmap=True).shape,
+                             cached.shape)
+            array.rmcache(self.filename)
+            parsed = array.loadtxt(self.filename)
+            self.assertEqual(parsed.shape, np.loadtxt(self.filename).shape)
+            self.assertEqual(cached.shape, parsed.shape)
+
+    def test_loadtxt_no_cache(self):
+        # only files written by savetxt are cached
+        np.savetxt(self.filename, np.random.rand(10, 3))
+        array.loadtxt(self.filename)
+        self.assertFalse(os.path.exists(array._cachename(self.filename)))
+
+    def test_saveloadtxt_cache(self):
+        M = np.random.rand(100, 5)
+        array.savetxt(self.filename, M, '%16.10e')
+        self.assertTrue(os.path.exists(array._cachename(self.filename)))
+        self.assertTrue(np.array_equal(array.loadtxt(self.filename), M))
+        self.assertTrue(np.allclose(np.loadtxt(self.filename), M))
+
+    def test_savetxt_nan(self):
+        for M in [np.array([1., np.nan, 3.]),
+                  np.array([[1., np.nan], [np.nan, 4.]])]:
+            array.savetxt(self.filename, M)
+            array.rmcache(self.filename)
+            for A in [array.loadtxt(self.filename), np.loadtxt(self.filename)]:
+                self.assertEqual(A.shape, M.shape)
+                self.assertTrue(np.array_equal(np.isnan(A), np.isnan(M)))
+                self.assertTrue(np.array_equal(A[~np.isnan(A)],
+                                               M[~np.isnan(M)]))
+
+    def test_loadtxt_mmap(self):
+        M = np.random.rand(100, 5)
+        array.savetxt(self.filename, M)
+        A = array.loadtxt(self.filename, mmap=True)
+        self.assertTrue(isinstance(A, np.memmap))
+        self.assertTrue(A[:, 2].flags['C_CONTIGUOUS'])
+        self.assertTrue(np.array_equal(A[:, 2], M[:, 2]))
+        del A
+
+    def test_loadtxt_stale_cache(self):
+        array.savetxt(self.filename, np.zeros(10))
+        v = np.random.rand(10)
+        np.savetxt(self.filename, v)
+        mtime = os.path.getmtime(array._cachename(self.filename))
+        os.utime(self.filename, (mtime+1., mtime+1.))
+        self.assertTrue(np.allclose(array.loadtxt(self.filename), v))
+
+    def test_loadtxt_rewritten_same_mtime(self):
+        array.savetxt(self.filename, np.zeros(10))
+        st = os.stat(self.filename)
+        v = np.random.rand(10)
+        np.savetxt(self.filename, v)
+        os.utime(self.filename, (st.st_atime, st.st_mtime))
+        self.assertEqual(os.path.getsize(self.filename), st.st_size)
+        self.assertTrue(np.array_equal(array.loadtxt(self.filename), v))
+
+    def test_loadtxt_replaced_same_mtime(self):
+        # as when export_residuals moves a new file onto an old one
+        array.savetxt(self.filename, np.zeros(10))
+        st = os.stat(self.filename)
+        v = np.random.rand(10)
+        np.savetxt(self.filename + '.new', v)
+        os.utime(self.filename + '.new', (st.st_atime, st.st_mtime))
+        os.rename(self.filename + '.new', self.filename)
+        self.assertTrue(np.array_equal(array.loadtxt(self.filename), v))
+        self.assertTrue(np.array_equal(
+            array.loadtxt(self.filename, mmap=True), v))
+
+    def test_gridsmooth_noninteger_span(self):
+        Z = np.zeros((41, 41))
+        Z[20, 20] = 1.
+        x = np.arange(41) - 20.
+        variances = []
+        for span in [2., 2.5, 3.]:
+            S = array.gridsmooth(Z, span)
+            # centered and symmetric
+            self.assertEqual(np.unravel_index(S.argmax(), S.shape), (20, 20))
+            self.assertTrue(np.allclose(S, S[::-1, ::-1]))
+            self.assertTrue(np.allclose(S, S.T))
+            p = S.sum(axis=0)/S.sum()
+            variances += [np.sum(p*x**2)]
+        # width grows continuously with span
+        self.assertTrue(variances[0] < variances[1] < variances[2])
+
+    def test_mesh2grid(self):
+        # non-square domain
+        mesh = np.random.rand(2000, 2) * [4., 1.]
+        v = np.ones(2000)
+        V, grid = array.mesh2grid(v, mesh)
+        nz, nx = V.shape
+        self.assertTrue(nx > nz)
+        self.assertTrue(abs(nx*nz - 2000) < 0.05*2000)
+        self.assertEqual(grid.shape, (nx*nz, 2))
+
+    def test_meshsmooth(self):
+        mesh = np.random.rand(2000, 2) * [4., 1.]
+        v = np.ones(2000)
+        vs = array.meshsmooth(v, mesh, 3.)
+        self.assertTrue(np.allclose(vs, 1.))
+
+    def test_meshsmooth_multiple_fields(self):
+        mesh = np.random.rand(2000, 2) * [4., 1.]
+        v = np.sin(4.*mesh[:, 0])
+        vs = array.meshsmooth(array.stack(v, 2.*v), mesh, 3.)
+        self.assertEqual(vs.shape, (2000, 2))
+        self.assertTrue(np.allclose(vs[:, 0], array.meshsmooth(v, mesh, 3.)))
+        self.assertTrue(np.allclose(vs[:, 1], 2.*vs[:, 0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
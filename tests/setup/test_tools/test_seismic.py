@@ -0,0 +1,63 @@
+
+import unittest
+
+import os
+from tempfile import NamedTemporaryFile
+
+from seisflows.tools import seismic
+
+
+class TestSeismicTools(unittest.TestCase):
+    def setUp(self):
+        tmp_file = NamedTemporaryFile(mode='wb', delete=False)
+        tmp_file.close()
+        self.filename = tmp_file.name
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def test_call_solver(self):
+        seismic.call_solver('', 'echo 1 2', output=self.filename)
+        with open(self.filename, 'r') as f:
+            self.assertEqual(f.read(), '1 2\n')
+
+    def test_call_solver_shell(self):
+        seismic.call_solver('', 'echo 1 && echo 2', output=self.filename)
+        with open(self.filename, 'r') as f:
+            self.assertEqual(f.read(), '1\n2\n')
+
+    def test_call_solver_error(self):
+        with self.assertRaises(SystemExit):
+            seismic.call_solver('', 'false', output=self.filename)
+
+    def test_call_solver_async(self):
+        wait = seismic.call_solver_async('', 'echo 1', output=self.filename)
+        wait()
+        with open(self.filename, 'r') as f:
+            self.assertEqual(f.read(), '1\n')
+
+    def test_call_solver_async_error(self):
+        wait = seismic.call_solver_async('', 'false', output=self.filename)
+        with self.assertRaises(SystemExit):
+            wait()
+
+    def test_setpars(self):
+        with open(self.filename, 'w') as f:
+            f.write('SIMULATION_TYPE = 1  # comment\n')
+            f.write('NSTEP = 100\n')
+            f.write('SAVE_FORWARD = .false.\n')
+        path, filename = os.path.split(self.filename)
+        seismic.setpars([('SIMULATION_TYPE', 3), ('SAVE_FORWARD', '.true.')],
+                        filename=filename, path=path)
+        self.assertEqual(seismic.getpar('SIMULATION_TYPE', self.filename,
+                                        cast=int), 3)
+        self.assertEqual(seismic.getpar('NSTEP', self.filename, cast=int),
+                         100)
+        self.assertEqual(seismic.getpar('SAVE_FORWARD', self.filename,
+                                        cast=lambda v: v.strip()), '.true.')
+        with open(self.filename, 'r') as f:
+            self.assertTrue('# comment' in f.readline())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+
+import unittest
+
+import pickle
+import shutil
+import sys
+import threading
+import time
+from tempfile import mkdtemp
+
+import numpy as np
+
+from seisflows.config import Dict
+from seisflows.tools.seismic import Container
+from seisflows.tools.tools import Struct
+
+# the solver module reads parameters and paths from sys.modules on import
+sys.modules['seisflows_parameters'] = Dict(
+    {'MATERIALS': 'Elastic', 'DENSITY': 'Constant'})
+sys.modules['seisflows_paths'] = Dict({'MODEL_INIT': 'model_init'})
+for name in ['system', 'preprocess']:
+    sys.modules['seisflows_'+name] = Dict({})
+
+from seisflows.solver.base import base
+
+
+class StubIO(object):
+    # stands in for the SPECFEM binary readers and writers
+    def __init__(self):
+        self.reads = []
+        self.writes = {}
+
+    def read_slice(self, path, name, iproc):
+        self.reads += [(path, name, iproc)]
+        return [np.ones(3)*iproc]
+
+    def write_slice(self, v, path, name, iproc):
+        self.writes[(name, iproc)] = v
+
+
+class StubSolver(base):
+    io = StubIO()
+
+    def __init__(self):
+        self._mesh_properties = Struct({'nproc': 2})
+
+
+class TestSolverSave(unittest.TestCase):
+    def setUp(self):
+        self.path = mkdtemp()
+        self.solver = StubSolver()
+        StubSolver.io = StubIO()
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def test_save_missing_parameters(self):
+        model = Container()
+        model['vp'] = [np.zeros(3), np.zeros(3)]
+        model['vs'] = [np.zeros(3), np.zeros(3)]
+        self.solver.save(model, self.path)
+        self.assertEqual(sorted(self.solver.io.reads),
+                         [('model_init', 'rho', 0), ('model_init', 'rho', 1)])
+        self.assertTrue(np.array_equal(
+            self.solver.io.writes[('rho', 1)], np.ones(3)))
+
+        # as in config.save, which checkpoints the solver
+        pickle.dumps(self.solver)
+
+
+class TestSolverIO(unittest.TestCase):
+    def setUp(self):
+        self.solver = base()
+
+    def test_wait_io(self):
+        done = []
+
+        def transfer(n):
+            time.sleep(0.1)
+            done.append(n)
+
+        self.solver.start_io(transfer, 1)
+        self.solver.start_io(transfer, n=2)
+        self.solver.wait_io()
+        self.assertEqual(sorted(done), [1, 2])
+        self.assertEqual(threading.active_count(), 1)
+
+        # nothing left to wait for
+        self.solver.wait_io()
+
+    def test_wait_io_error(self):
+        def transfer():
+            raise IOError('transfer failed')
+
+        self.solver.start_io(transfer)
+        with self.assertRaises(IOError):
+            self.solver.wait_io()
+
+        # errors are raised only once
+        self.solver.wait_io()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+
+import unittest
+
+import os
+import shutil
+from tempfile import mkdtemp
+
+from seisflows.tools import unix
+
+
+class TestUnixTools(unittest.TestCase):
+    def setUp(self):
+        self.path = mkdtemp()
+        self.src = os.path.join(self.path, 'src')
+        self.dst = os.path.join(self.path, 'dst')
+        os.makedirs(os.path.join(self.src, 'sub'))
+        for name in ['a', 'b', '.a.npy', 'sub/c']:
+            with open(os.path.join(self.src, name), 'w') as f:
+                f.write(name)
+
+    def tearDown(self):
+        shutil.rmtree(self.path)
+
+    def assertContents(self, path, names):
+        found = []
+        for root, dirs, files in os.walk(path):
+            for name in files:
+                found += [os.path.relpath(os.path.join(root, name), path)]
+        self.assertEqual(sorted(found), sorted(names))
+
+    def test_rsync_files(self):
+        src = [os.path.join(self.src, 'a'), os.path.join(self.src, 'b')]
+        unix.rsync(src, self.dst)
+        self.assertContents(self.dst, ['a', 'b'])
+
+    def test_rsync_dir(self):
+        # repeated calls merge into dst, rather than nest src inside it
+        unix.rsync(self.src, self.dst)
+        unix.rsync(self.src, self.dst)
+        self.assertContents(self.dst, ['a', 'b', 'sub/c'])
+
+    def test_rsync_hidden(self):
+        src = [os.path.join(self.src, 'a'), os.path.join(self.src, '.a.npy')]
+        unix.rsync(src, self.dst)
+        self.assertContents(self.dst, ['a'])
+
+    def test_rsync_fallback(self):
+        which = unix.which
+        unix.which = lambda name: None
+        try:
+            self.test_rsync_files()
+            unix.rsync(self.src, self.dst)
+            unix.rsync(self.src, self.dst)
+        finally:
+            unix.which = which
+        self.assertContents(self.dst, ['a', 'b', 'sub/c'])
+
+
+if __name__ == '__main__':
+    unittest.main()